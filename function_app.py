@@ -1,21 +1,64 @@
 import azure.functions as func
 import fastapi
-import requests
-from typing import List, Optional, Dict, Any
+import httpx
+import asyncio
+import orjson
+import ijson
+from cachetools import TTLCache
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Dict, Any, Sequence, Tuple
 from dotenv import load_dotenv
 import os
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
-import secrets
+from fastapi import Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
+import base64
+import hmac
+import functools
+import contextlib
 from loguru import logger 
 
 load_dotenv()
 
+# Read configuration once at import instead of on every request
+TOPDESK_BASE_URL = "https://cartaoelo.topdesk.net/tas/api"
+TOPDESK_USER = os.getenv("TOPDESK_USER", "aaa")
+TOPDESK_API_KEY = os.getenv("TOPDESK_API_KEY", "aaa")
+if not TOPDESK_USER or not TOPDESK_API_KEY:
+    raise RuntimeError("TOPDESK_USER or TOPDESK_API_KEY not set in .env file.")
+API_USERNAME = os.getenv("API_USERNAME", "apiuser")
+API_PASSWORD = os.getenv("API_PASSWORD", "apipass")
+# Single asset pages requested with a pageSize above this (or with pageStart but no pageSize)
+# are stream-parsed to keep peak memory down. Full listings go through iter_assets in
+# 100-row pages and stay on orjson.
+ASSETS_STREAM_PAGE_SIZE = 1000
+# Batch endpoints: how many IDs one call may ask for and how many TopDesk lookups run at once
+BATCH_MAX_IDS = 100
+BATCH_CONCURRENCY = 10
+
+# Base64 credentials expected after "Basic " in the Authorization header
+_EXPECTED_BASIC_TOKEN = base64.b64encode(f"{API_USERNAME}:{API_PASSWORD}".encode())
+
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson. Defined locally because fastapi.responses.ORJSONResponse is deprecated.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 class TopDeskClient:
     """
     Python client for the TopDesk Metrics API (4Key) using Basic Auth.
     """
 
+    __slots__ = (
+        "base_url", "client",
+        "_incidents_url", "_incident_id_url", "_assets_url", "_asset_id_url",
+        "_changes_url", "_change_id_url",
+        "incident_cache", "asset_cache", "change_cache",
+    )
+
     def __init__(self, base_url: str, username: str, password: str):
         """
         :param base_url: Base URL of the TopDesk API, e.g., "https://cartaoelo.topdesk.net/tas/api"
@@ -23,45 +66,158 @@ class TopDeskClient:
         :param password: API password
         """
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.auth = (username, password)
-        self.session.headers.update({
-            "Accept": "application/json"
-        })
+        # Encode the Basic Auth header once instead of running an auth flow per request
+        token = base64.b64encode(f"{username}:{password}".encode()).decode()
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Basic {token}",
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, br"
+            },
+            timeout=30,
+            # Concurrent calls multiplex over one connection when TopDesk negotiates h2;
+            # otherwise httpx falls back to HTTP/1.1 with the same keep-alive pool
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+        )
+        # Endpoint paths, relative to base_url, built once per client
+        self._incidents_url = "/incidents"
+        self._incident_id_url = self._incidents_url + "/id/"
+        self._assets_url = "/assetmgmt/assets"
+        self._asset_id_url = self._assets_url + "/id/"
+        self._changes_url = "/operatorChanges"
+        self._change_id_url = self._changes_url + "/"
+        # Records by ID change slowly; keep them for a minute to spare TopDesk round-trips
+        self.incident_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        self.asset_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        self.change_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _get_content(self, path: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        resp = await self.client.get(path, params=params)
+        resp.raise_for_status()
+        return resp.content
+
+    async def _stream_items(self, path: str, prefix: str, params: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Decodifica incrementalmente os itens sob `prefix` sem manter a resposta inteira em memória.
+        """
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, prefix, use_float=True)
+        async with self.client.stream("GET", path, params=params) as resp:
+            resp.raise_for_status()
+            if resp.status_code == 204:
+                return []
+            async for chunk in resp.aiter_bytes():
+                parser.send(chunk)
+        parser.close()
+        return items
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        content = await self._get_content(path, params=params)
+        if not content:
+            # TopDesk answers 204 No Content when a page is past the end
+            return None
+        return orjson.loads(content)
+
+    async def _gather_bounded(
+        self,
+        fetch: Callable[[str], Awaitable[Dict[str, Any]]],
+        ids: Sequence[str]
+    ) -> List[Any]:
+        """
+        Busca os IDs em paralelo, no máximo BATCH_CONCURRENCY por vez; o resultado segue a ordem de `ids`.
+        """
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def bounded(record_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch(record_id)
+
+        return await asyncio.gather(*(bounded(i) for i in ids), return_exceptions=True)
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[List[Dict[str, Any]]]],
+        page_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Itera sobre as páginas buscando a próxima em segundo plano enquanto a atual é consumida.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def produce():
+            pageStart = 0
+            try:
+                while True:
+                    page = await fetch_page(pageStart, page_size)
+                    await queue.put(page)
+                    if len(page) < page_size:
+                        break
+                    pageStart += page_size
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                if page:
+                    yield page
+        finally:
+            producer.cancel()
 
     # ------------------------------
     # Incident Endpoints
     # ------------------------------
-    def list_incidents(self, pageStart: Optional[int] = None,
+    async def list_incidents(self, pageStart: Optional[int] = None,
                              pageSize: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Listar chamados (incidentes).
         """
-        logger.info(f"Fetching incidents with pageStart: {pageStart}, pageSize: {pageSize}")
-        url = f"{self.base_url}/incidents"
-        params = {}
-        if pageStart is not None or pageSize is not None:
-            if pageStart is not None:
-                params["pageStart"] = pageStart
-            if pageSize is not None:
-                params["pageSize"] = pageSize
-        resp = self.session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        logger.info("Fetching incidents with pageStart: {}, pageSize: {}", pageStart, pageSize)
+        path = self._incidents_url
+        params = {k: v for k, v in (("pageStart", pageStart), ("pageSize", pageSize)) if v is not None}
+        return (await self._get_json(path, params=params)) or []
+
+    def iter_incidents(self, page_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Percorrer todos os chamados página a página, com a próxima página já em andamento.
+        """
+        return self._iter_pages(self.list_incidents, page_size)
     
-    def get_incident_by_id(self, incident_id: str) -> Dict[str, Any]:
-        url = f"{self.base_url}/incidents/id/{incident_id}"
-        resp = self.session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+    async def get_incident_by_id(self, incident_id: str, no_cache: bool = False) -> Dict[str, Any]:
+        if not no_cache:
+            cached = self.incident_cache.get(incident_id)
+            if cached is not None:
+                return cached
+        path = self._incident_id_url + incident_id
+        incident = (await self._get_json(path)) or {}
+        self.incident_cache[incident_id] = incident
+        return incident
+
+    async def get_incidents_batch(self, ids: List[str], no_cache: bool = False) -> List[Any]:
+        """
+        Obter vários incidentes em paralelo. Falhas são retornadas como exceções na posição do ID.
+        """
+        return await self._gather_bounded(lambda i: self.get_incident_by_id(i, no_cache), ids)
     
     # ------------------------------
     # Transaction Assets
     # ------------------------------
-    def get_transaction_assets(
+    async def get_transaction_assets(
         self,
         template_id: Optional[str] = None,
-        fields: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
         filter: Optional[str] = None,
         pageStart: Optional[int] = None,
         pageSize: Optional[int] = None
@@ -72,55 +228,91 @@ class TopDeskClient:
         :param template_id: Template ID (string)
         :param fields: Optional list of fields to include
         """
-        logger.info(f"Fetching assets for template_id: {template_id}, fields: {fields}, filter: {filter}, pageStart: {pageStart}, pageSize: {pageSize}")
-        url = f"{self.base_url}/assetmgmt/assets"
-        params = {}
-        if template_id:
-            params["templateId"] = template_id
-        if fields:
-            params["field"] = fields
-        if filter:
-            params["$filter"] = filter
-        if pageStart is not None or pageSize is not None:
-            if pageStart is not None:
-                params["pageStart"] = pageStart
-            if pageSize is not None:
-                params["pageSize"] = pageSize
-        resp = self.session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json().get('dataSet', [])
+        logger.info("Fetching assets for template_id: {}, fields: {}, filter: {}, pageStart: {}, pageSize: {}",
+                    template_id, fields, filter, pageStart, pageSize)
+        path = self._assets_url
+        params = {k: v for k, v in (("templateId", template_id or None),
+                                    ("field", fields or None),
+                                    ("$filter", filter or None),
+                                    ("pageStart", pageStart),
+                                    ("pageSize", pageSize)) if v is not None}
+        # pageSize is None only for explicit pageStart calls; /v1/assets without paging uses iter_assets
+        if pageSize is None or pageSize > ASSETS_STREAM_PAGE_SIZE:
+            return await self._stream_items(path, 'dataSet.item', params=params)
+        return ((await self._get_json(path, params=params)) or {}).get('dataSet', [])
+
+    def iter_assets(
+        self,
+        template_id: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        filter: Optional[str] = None,
+        page_size: int = 100
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Percorrer todos os ativos transacionais página a página, com a próxima página já em andamento.
+        """
+        async def fetch_page(pageStart: int, pageSize: int) -> List[Dict[str, Any]]:
+            return await self.get_transaction_assets(template_id=template_id, fields=fields, filter=filter,
+                                                     pageStart=pageStart, pageSize=pageSize)
+        return self._iter_pages(fetch_page, page_size)
     
-    def get_asset_by_id(self, asset_id: str) -> Dict[str, Any]:
-        url = f"{self.base_url}/assetmgmt/assets/id/{asset_id}"
-        resp = self.session.get(url)
-        resp.raise_for_status()
-        return resp.json()
+    async def get_asset_by_id(self, asset_id: str, no_cache: bool = False) -> Dict[str, Any]:
+        if not no_cache:
+            cached = self.asset_cache.get(asset_id)
+            if cached is not None:
+                return cached
+        path = self._asset_id_url + asset_id
+        asset = (await self._get_json(path)) or {}
+        self.asset_cache[asset_id] = asset
+        return asset
+
+    async def get_assets_batch(self, ids: List[str], no_cache: bool = False) -> List[Any]:
+        """
+        Obter vários ativos em paralelo. Falhas são retornadas como exceções na posição do ID.
+        """
+        return await self._gather_bounded(lambda i: self.get_asset_by_id(i, no_cache), ids)
 
     # ------------------------------
     # Change Records
     # ------------------------------
-    def list_changes(self, fields: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def list_changes(self, fields: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Listar mudanças (Change records).
 
         :param fields: Optional, e.g. "all"
         """
-        url = f"{self.base_url}/operatorChanges"
-        params = {}
-        if fields:
-            params["fields"] = fields
-        resp = self.session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json().get('results', [])
+        path = self._changes_url
+        params = {"fields": fields} if fields else None
+        return ((await self._get_json(path, params=params)) or {}).get('results', [])
     
-    def get_change_by_id(self, change_id: str, fields: Optional[str] = None) -> Dict[str, Any]:
-        url = f"{self.base_url}/operatorChanges/{change_id}"
-        params = {}
-        if fields:
-            params["fields"] = fields
-        resp = self.session.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+    async def get_change_by_id(self, change_id: str, fields: Optional[str] = None,
+                               no_cache: bool = False) -> Dict[str, Any]:
+        key = (change_id, fields)
+        if not no_cache:
+            cached = self.change_cache.get(key)
+            if cached is not None:
+                return cached
+        path = self._change_id_url + change_id
+        params = {"fields": fields} if fields else None
+        change = (await self._get_json(path, params=params)) or {}
+        self.change_cache[key] = change
+        return change
+
+    async def get_changes_batch(self, ids: List[str], fields: Optional[str] = None,
+                                no_cache: bool = False) -> List[Any]:
+        """
+        Obter várias mudanças em paralelo. Falhas são retornadas como exceções na posição do ID.
+        """
+        return await self._gather_bounded(lambda i: self.get_change_by_id(i, fields, no_cache), ids)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: fastapi.FastAPI):
+    # Open the TopDesk connection pool once and close it on shutdown
+    client = get_topdesk_client()
+    yield
+    await client.aclose()
+    get_topdesk_client.cache_clear()
 
 
 fapi_app = fastapi.FastAPI(
@@ -149,54 +341,111 @@ fapi_app = fastapi.FastAPI(
             "description": "Endpoints relacionados a mudanças (Change records) no TopDesk.",
         }
     ],
-    openapi_version="3.0.1"
+    openapi_version="3.0.1",
+    lifespan=lifespan
 )
 
 
-def get_topdesk_client():
-    base_url = "https://cartaoelo.topdesk.net/tas/api"
-    user = os.getenv("TOPDESK_USER", "aaa")
-    password = os.getenv("TOPDESK_API_KEY", "aaa")
-    if not user or not password:
-        raise RuntimeError("TOPDESK_USER or TOPDESK_API_KEY not set in .env file.")
-    return TopDeskClient(base_url=base_url, username=user, password=password)
-
-security = HTTPBasic()
-API_USERNAME = os.getenv("API_USERNAME", "apiuser")
-API_PASSWORD = os.getenv("API_PASSWORD", "apipass")
+@functools.lru_cache(maxsize=1)
+def get_topdesk_client() -> TopDeskClient:
+    # Reuse a single AsyncClient so its connection pool survives across requests
+    return TopDeskClient(base_url=TOPDESK_BASE_URL, username=TOPDESK_USER, password=TOPDESK_API_KEY)
 
-def verify_basic_auth(credentials: HTTPBasicCredentials = Depends(security)):
-    # Replace with your desired username/password
-    correct_username = secrets.compare_digest(credentials.username, API_USERNAME)
-    correct_password = secrets.compare_digest(credentials.password, API_PASSWORD)
-    if not (correct_username and correct_password):
+async def verify_basic_auth(request: Request) -> str:
+    # Compare the raw header against the precomputed token instead of decoding it into HTTPBasicCredentials
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "basic" or not hmac.compare_digest(token.strip().encode(), _EXPECTED_BASIC_TOKEN):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Basic"},
         )
-    return credentials.username
+    return API_USERNAME
+
+_default_openapi = fapi_app.openapi
+
+def openapi_with_basic_auth() -> Dict[str, Any]:
+    # verify_basic_auth no longer goes through HTTPBasic, so declare the scheme for the docs here
+    if fapi_app.openapi_schema:
+        return fapi_app.openapi_schema
+    schema = _default_openapi()
+    schema.setdefault("components", {}).setdefault("securitySchemes", {})["HTTPBasic"] = {
+        "type": "http",
+        "scheme": "basic",
+    }
+    for path_item in schema.get("paths", {}).values():
+        for operation in path_item.values():
+            operation["security"] = [{"HTTPBasic": []}]
+    return schema
+
+fapi_app.openapi = openapi_with_basic_auth
+
+@functools.lru_cache(maxsize=256)
+def _parse_fields(raw: str) -> Tuple[str, ...]:
+    # Callers tend to resend the same fields= value, so parse each distinct one only once
+    return tuple(f for f in raw.strip().split(',') if f)
+
+def _check_batch_ids(ids: List[str]) -> List[str]:
+    # De-duplicate and bound the fan-out a single call can trigger against TopDesk
+    unique_ids = list(dict.fromkeys(ids))
+    if len(unique_ids) > BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"At most {BATCH_MAX_IDS} distinct ids are allowed per batch request",
+        )
+    return unique_ids
+
+def _batch_results(ids: List[str], results: List[Any]) -> ORJSONResponse:
+    # Key each record by its ID so callers can match results to their input; failed lookups map to null
+    out: Dict[str, Optional[Dict[str, Any]]] = {}
+    for record_id, r in zip(ids, results):
+        if isinstance(r, BaseException):
+            logger.error("{}: {}", record_id, r)
+            out[record_id] = None
+        else:
+            out[record_id] = r
+    return ORJSONResponse(content=out)
 
 
 @fapi_app.get(
     "/v1/incidents",
+    response_class=ORJSONResponse,
     operation_id="list_incidents",
-    response_model=List[Dict[str, Any]],
+    response_model=None,
     tags=["Incident"],
     summary="Retorna incidentes do TopDesk",
     description="Lista todos os incidentes."
 )
-def list_incidents(
+async def list_incidents(
     pageStart: Optional[int] = None, pageSize: Optional[int] = None, _: str = Depends(verify_basic_auth)
-) -> List[Dict[str, Any]]:
+) -> ORJSONResponse:
     logger.info('GET /v1/incidents')
     client = get_topdesk_client()
     try:
-        # Pass pagination params to TopDeskClient when implemented
-        return client.list_incidents(pageStart, pageSize)  # TODO: add pagination support in client
+        if pageStart is None and pageSize is None:
+            incidents = [incident async for page in client.iter_incidents() for incident in page]
+        else:
+            incidents = await client.list_incidents(pageStart, pageSize)
     except Exception as e:
         logger.error(str(e))
-        return []
+        incidents = []
+    # Returning the response directly skips FastAPI's jsonable_encoder walk over every row
+    return ORJSONResponse(content=incidents)
+
+@fapi_app.get(
+    "/v1/incidents:batch",
+    response_class=ORJSONResponse,
+    operation_id="get_incidents_batch",
+    response_model=None,
+    tags=["Incident"],
+    summary="Retorna vários incidentes do TopDesk dados seus identificadores.",
+    description=f"Obtém em paralelo os incidentes correspondentes aos IDs informados (até {BATCH_MAX_IDS} IDs distintos). Retorna um objeto ID → registro, com null para as buscas que falharam."
+)
+async def get_incidents_batch(ids: List[str] = Query(...), no_cache: bool = False, _: str = Depends(verify_basic_auth)) -> ORJSONResponse:
+    logger.info('GET /v1/incidents:batch')
+    client = get_topdesk_client()
+    unique_ids = _check_batch_ids(ids)
+    return _batch_results(unique_ids, await client.get_incidents_batch(unique_ids, no_cache))
 
 @fapi_app.get(
     "/v1/incidents/{incident_id:str}",
@@ -206,45 +455,63 @@ def list_incidents(
     summary="Retorna incidente específico do TopDesk dado seu identificador.",
     description="Obtém um incidente específico pelo ID."
 )
-def get_incident(incident_id: str, _: str = Depends(verify_basic_auth)) -> Dict[str, Any]:
+async def get_incident(incident_id: str, no_cache: bool = False, _: str = Depends(verify_basic_auth)) -> Dict[str, Any]:
     logger.info('GET /v1/incidents')
     client = get_topdesk_client()
     try:
-        return client.get_incident_by_id(incident_id)
+        return await client.get_incident_by_id(incident_id, no_cache)
     except Exception as e:
         logger.error(str(e))
         return {}
 
 @fapi_app.get(
     "/v1/assets",
+    response_class=ORJSONResponse,
     operation_id="list_assets",
-    response_model=List[Dict[str, Any]],
+    response_model=None,
     tags=["Assets"],
     summary="Retorna ativos do TopDesk",
     description="Lista todos os ativos transacionais por Template ID."
 )
-def list_assets(
+async def list_assets(
     template_id: Optional[str] = None,
     fields: Optional[str] = None,
     filter: Optional[str] = None,
     pageStart: Optional[int] = None,
     pageSize: Optional[int] = None,
     _: str = Depends(verify_basic_auth)
-) -> List[Dict[str, Any]]:
+) -> ORJSONResponse:
     logger.info('GET /v1/assets')
     client = get_topdesk_client()    
-    fields_lst = None
-    if fields:
-        fields = fields.strip()
-        if fields:
-            fields_lst = fields.split(',')
+    fields_lst = _parse_fields(fields) if fields else None
     try:
-        return client.get_transaction_assets(template_id=template_id,
-                                             fields=fields_lst, filter=filter,
-                                             pageStart=pageStart, pageSize=pageSize)
+        if pageStart is None and pageSize is None:
+            assets = [asset async for page in client.iter_assets(template_id=template_id,
+                                                                  fields=fields_lst, filter=filter)
+                      for asset in page]
+        else:
+            assets = await client.get_transaction_assets(template_id=template_id,
+                                                         fields=fields_lst, filter=filter,
+                                                         pageStart=pageStart, pageSize=pageSize)
     except Exception as e:
         logger.error(str(e))
-        return [] # fixme: fastapi must return server side error with error message
+        assets = [] # fixme: fastapi must return server side error with error message
+    return ORJSONResponse(content=assets)
+
+@fapi_app.get(
+    "/v1/assets:batch",
+    response_class=ORJSONResponse,
+    operation_id="get_assets_batch",
+    response_model=None,
+    tags=["Assets"],
+    summary="Retorna vários ativos do TopDesk dados seus identificadores.",
+    description=f"Obtém em paralelo os ativos correspondentes aos IDs informados (até {BATCH_MAX_IDS} IDs distintos). Retorna um objeto ID → registro, com null para as buscas que falharam."
+)
+async def get_assets_batch(ids: List[str] = Query(...), no_cache: bool = False, user: str = Depends(verify_basic_auth)) -> ORJSONResponse:
+    logger.info('GET /v1/assets:batch')
+    client = get_topdesk_client()
+    unique_ids = _check_batch_ids(ids)
+    return _batch_results(unique_ids, await client.get_assets_batch(unique_ids, no_cache))
 
 @fapi_app.get(
     "/v1/assets/{asset_id:str}",
@@ -254,11 +521,11 @@ def list_assets(
     summary="Retorna ativo do TopDesk dado seu identificador.",
     description="Obtém um ativo específico pelo ID."
 )
-def get_asset(asset_id: str, user: str = Depends(verify_basic_auth)) -> Dict[str, Any]:
+async def get_asset(asset_id: str, no_cache: bool = False, user: str = Depends(verify_basic_auth)) -> Dict[str, Any]:
     logger.info('GET /assets')
     client = get_topdesk_client()
     try:
-        return client.get_asset_by_id(asset_id)
+        return await client.get_asset_by_id(asset_id, no_cache)
     except Exception as e:
         logger.error(str(e))
         return {} # fixme: fastapi must return server side error with error message
@@ -266,20 +533,37 @@ def get_asset(asset_id: str, user: str = Depends(verify_basic_auth)) -> Dict[str
 
 @fapi_app.get(
     "/v1/changes",
+    response_class=ORJSONResponse,
     operation_id="list_changes",
-    response_model=List[Dict[str, Any]],
+    response_model=None,
     tags=["Changes"],
     summary="Retorna mudanças (changes) do TopDesk.",
     description="Lista todas as mudanças."
 )
-def list_changes(fields: Optional[str], user: str = Depends(verify_basic_auth)) -> List[Dict[str, Any]]:
+async def list_changes(fields: Optional[str], user: str = Depends(verify_basic_auth)) -> ORJSONResponse:
     logger.info('GET /changes')
     client = get_topdesk_client()
     try:
-        return client.list_changes(fields=fields)
+        changes = await client.list_changes(fields=fields)
     except Exception as e:
         logger.error(str(e))
-        return [] # fix me: fastapi must return server side error with error message
+        changes = [] # fix me: fastapi must return server side error with error message
+    return ORJSONResponse(content=changes)
+    
+@fapi_app.get(
+    "/v1/changes:batch",
+    response_class=ORJSONResponse,
+    operation_id="get_changes_batch",
+    response_model=None,
+    tags=["Changes"],
+    summary="Retorna várias mudanças do TopDesk dados seus identificadores.",
+    description=f"Obtém em paralelo as mudanças correspondentes aos IDs informados (até {BATCH_MAX_IDS} IDs distintos). Retorna um objeto ID → registro, com null para as buscas que falharam."
+)
+async def get_changes_batch(ids: List[str] = Query(...), fields: Optional[str] = None, no_cache: bool = False, user: str = Depends(verify_basic_auth)) -> ORJSONResponse:
+    logger.info('GET /v1/changes:batch')
+    client = get_topdesk_client()
+    unique_ids = _check_batch_ids(ids)
+    return _batch_results(unique_ids, await client.get_changes_batch(unique_ids, fields, no_cache))
     
 @fapi_app.get(
     "/v1/changes/{change_id:str}",
@@ -289,14 +573,25 @@ def list_changes(fields: Optional[str], user: str = Depends(verify_basic_auth))
     summary="Retorna uma mudança específica do TopDesk dado seu identificador.",
     description="Obtém uma mudança específica pelo ID."
 )
-def get_change(change_id: str, fields: Optional[str], user: str = Depends(verify_basic_auth)) -> Dict[str, Any]:
+async def get_change(change_id: str, fields: Optional[str], no_cache: bool = False, user: str = Depends(verify_basic_auth)) -> Dict[str, Any]:
     logger.info('GET /changes/{change_id}')
     client = get_topdesk_client()
     try:
-        return client.get_change_by_id(change_id, fields)
+        return await client.get_change_by_id(change_id, fields, no_cache)
     except Exception as e:
         logger.error(str(e))
         return {} # fix me: fastapi must return server side error with error message
     
 
 app = func.AsgiFunctionApp(app=fapi_app, http_auth_level=func.AuthLevel.ANONYMOUS)
+
+
+# ------------------------------
+# Standalone server (outside Azure Functions)
+# ------------------------------
+# Equivalent to: python -m uvicorn function_app:fapi_app --loop uvloop --http httptools --workers $(nproc) --no-access-log
+if __name__ == "__main__":
+    import uvicorn
+    # "auto" resolves to uvloop/httptools when installed and falls back where they are unavailable (e.g. Windows)
+    uvicorn.run("function_app:fapi_app", host="0.0.0.0", port=int(os.getenv("PORT", "8000")),
+                loop="auto", http="auto", workers=os.cpu_count() or 1, access_log=False)
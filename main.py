@@ -1,12 +1,12 @@
 import os
+import asyncio
 from function_app import TopDeskClient
 from dotenv import load_dotenv
 
 # ------------------------------
 # Example Usage
 # ------------------------------
-if __name__ == "__main__":
-    load_dotenv()
+async def main():
     base_url = "https://cartaoelo.topdesk.net/tas/api"
     user = os.getenv("TOPDESK_USER")
     password = os.getenv("TOPDESK_API_KEY")
@@ -19,11 +19,11 @@ if __name__ == "__main__":
     )
 
     # List incidents
-    incidents = client.list_incidents()
+    incidents = await client.list_incidents()
     print(f"Found {len(incidents)} incidents")
 
     print(incidents[0]['id'])
-    incident = client.get_incident_by_id(incidents[0]['id'])
+    incident = await client.get_incident_by_id(incidents[0]['id'])
     if incident:
         print(f"Incident {incident['id']}: {incident['status']} - {incident['request']}")
 
@@ -31,7 +31,7 @@ if __name__ == "__main__":
     #    print(incidents[0])
 
     # Get transaction assets
-    #assets = client.get_transaction_assets(
+    #assets = await client.get_transaction_assets(
     #    template_id="561F3666-E5F0-429E-9508-1AAD5DB6EE04",
     #    fields=["name", "volume-debito", "numero-do-chamado"]
     #)
@@ -40,12 +40,16 @@ if __name__ == "__main__":
     #    print(assets[0])
 
     # List changes
-    changes = client.list_changes(fields="all")
+    changes = await client.list_changes(fields="all")
     print(f"Found {len(changes)} changes")
 
-    change = client.get_change_by_id(changes[0]['id'])
+    change = await client.get_change_by_id(changes[0]['id'])
     if change:
         print(f"Change {change['id']}: {change['status']['name']} - {change['briefDescription']}")
-    
 
-    
\ No newline at end of file
+    await client.aclose()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    asyncio.run(main())